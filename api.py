@@ -7,12 +7,23 @@ Navigate to: Machine to Machine > Access Token > Generate Token
 """
 
 import requests
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime, timedelta
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 
 class VegetationAPI:
     def __init__(self, token: str):
         self.base_url = "https://m2m.cr.usgs.gov/api/api/json/stable/"
         self.token = token
+        # Reuse keep-alive connections across searches instead of a new
+        # TCP+TLS handshake per request
+        self.session = requests.Session()
+        self.session.mount("https://", HTTPAdapter(
+            pool_connections=8,
+            pool_maxsize=16,
+            max_retries=Retry(total=3, backoff_factor=0.3)
+        ))
         
     def search_scenes(self, bbox, start_date: str, end_date: str, max_cloud: int = 20):
         """
@@ -42,7 +53,7 @@ class VegetationAPI:
             "maxResults": 25
         }
         
-        response = requests.post(url, json=payload)
+        response = self.session.post(url, json=payload, timeout=30)
         result = response.json()
         
         if result.get('errorCode'):
@@ -51,6 +62,27 @@ class VegetationAPI:
             
         return result.get('data', {}).get('results', [])
     
+    def search_many(self, bboxes, start_date: str, end_date: str, max_cloud: int = 20,
+                    max_workers: int = 8):
+        """
+        Search several areas concurrently over the shared session
+        
+        Args:
+            bboxes: List of (min_lon, min_lat, max_lon, max_lat) in WGS84
+            start_date: "YYYY-MM-DD"
+            end_date: "YYYY-MM-DD"
+            max_cloud: Maximum cloud cover %
+            max_workers: Number of searches in flight at once
+        
+        Returns:
+            List of scene lists, one per bbox, in the same order
+        """
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(
+                lambda bbox: self.search_scenes(bbox, start_date, end_date, max_cloud),
+                bboxes
+            ))
+    
     def get_scene_info(self, scene):
         """Extract key info from scene metadata"""
         return {
@@ -0,0 +1,28 @@
+"""
+Ahead-of-time NDVI kernel for vegetation_ortho.py
+
+Compile once with pythran to skip Numba's per-process JIT warmup:
+
+    pythran -DUSE_XSIMD -fopenmp -march=native -O3 ndvi_kernel.py
+
+vegetation_ortho.py only uses the compiled extension; this source file on
+its own is never imported as the kernel, since pure-Python loops would be
+far slower than the Numba or NumPy paths.
+"""
+
+
+#pythran export ndvi(float32[:,:], float32[:,:], float, float, float, float, float, int, int16[:,:])
+def ndvi(red, nir, r_mult, r_add, n_mult, n_add, scale, nodata, out):
+    """Fused DN->reflectance, NDVI, clip and scale in a single pass over the window"""
+    #omp parallel for
+    for i in range(red.shape[0]):
+        for j in range(red.shape[1]):
+            r = red[i, j] * r_mult + r_add
+            n = nir[i, j] * n_mult + n_add
+            s = n + r
+            if nir[i, j] + red[i, j] == 0 or s == 0:
+                out[i, j] = nodata
+            else:
+                v = (n - r) / s
+                out[i, j] = round(min(max(v, -1.0), 1.0) * scale)
+    return out
@@ -0,0 +1,281 @@
+import rasterio
+import numpy as np
+import os
+from importlib.machinery import EXTENSION_SUFFIXES
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from pathlib import Path
+from rasterio.enums import Resampling
+
+try:
+    import ndvi_kernel  # pythran-compiled NDVI kernel, see ndvi_kernel.py
+    if not ndvi_kernel.__file__.endswith(tuple(EXTENSION_SUFFIXES)):
+        ndvi_kernel = None  # uncompiled source: slower than Numba or NumPy
+except ImportError:
+    ndvi_kernel = None
+
+try:
+    from numba import njit, prange
+except ImportError:  # numba is optional; ndvi_tile falls back to NumPy
+    njit = None
+
+#Loads the Bands in Python
+data_filepath = '/Users/annivoigt/Documents/data/'
+b4_pattern = '*B4.TIF'
+
+# Edge length of the output tiles, which are also the NDVI compute windows,
+# when the input is striped; a 256x256 float32 window of both bands fits in
+# L2 cache. Tiled inputs (COGs) keep their own block shape instead.
+TILE_SIZE = 256
+
+# Internal overview levels, so QGIS and tile servers can browse the NDVI
+# raster at any zoom without reading full resolution
+OVERVIEW_FACTORS = [2, 4, 8, 16, 32]
+
+# GDAL settings for the whole run: skip sibling-directory scans on every
+# open, cache small reads, and give the block cache room for both bands
+GDAL_ENV = dict(
+    GDAL_DISABLE_READDIR_ON_OPEN='EMPTY_DIR',
+    CPL_VSIL_CURL_ALLOWED_EXTENSIONS='.tif,.TIF',
+    VSI_CACHE='YES',
+    VSI_CACHE_SIZE=268435456,  # 256 MB
+    GDAL_CACHEMAX=1024,  # MB, per worker process
+    GDAL_NUM_THREADS='ALL_CPUS',
+    GDAL_INGESTED_BYTES_AT_OPEN=32768,  # fetch the TIFF header in one read
+)
+
+# NDVI is stored as int16 scaled by 10000 (the MODIS/Landsat convention);
+# readers apply ndvi = value * 0.0001
+NDVI_SCALE = 10000
+NDVI_NODATA = -9999
+
+# (red_mult, red_add, nir_mult, nir_add) that leave DNs unchanged, used when
+# a scene has no MTL metadata
+DN_COEFFICIENTS = (1.0, 0.0, 1.0, 0.0)
+
+
+if njit is not None and ndvi_kernel is None:
+    # fastmath is safe: inputs come from integer DNs and the kernel never
+    # produces NaN, it writes NDVI_NODATA directly
+    @njit(parallel=True, fastmath=True, cache=True)
+    def _ndvi_kernel(red, nir, r_mult, r_add, n_mult, n_add, out):
+        """Fused DN->reflectance, NDVI, clip and scale in a single pass over the window"""
+        for i in prange(red.shape[0]):
+            for j in range(red.shape[1]):
+                r = red[i, j] * r_mult + r_add
+                n = nir[i, j] * n_mult + n_add
+                s = n + r
+                if nir[i, j] + red[i, j] == 0 or s == 0:
+                    out[i, j] = NDVI_NODATA
+                else:
+                    v = (n - r) / s
+                    out[i, j] = round(min(max(v, -1.0), 1.0) * NDVI_SCALE)
+        return out
+
+
+def tile_buffer(buf, shape, dtype):
+    """Return buf if it already has the window's shape, else a fresh array (edge tiles)"""
+    if buf is not None and buf.shape == shape:
+        return buf
+    return np.empty(shape, dtype=dtype)
+
+
+def ndvi_tile(red, nir, coefficients=DN_COEFFICIENTS, out=None):
+    """
+    Compute int16-scaled NDVI for one float32 window of DNs, into out when it fits
+
+    DNs are converted to reflectance with coefficients (see
+    read_reflectance_coefficients) before the ratio. Pixels whose DNs sum
+    to 0 are fill and become NDVI_NODATA.
+    """
+    r_mult, r_add, n_mult, n_add = coefficients
+    out = tile_buffer(out, red.shape, np.int16)
+    if ndvi_kernel is not None:
+        return ndvi_kernel.ndvi(red, nir, r_mult, r_add, n_mult, n_add,
+                                float(NDVI_SCALE), NDVI_NODATA, out)
+    if njit is not None:
+        return _ndvi_kernel(red, nir, r_mult, r_add, n_mult, n_add, out)
+
+    fill = (nir + red) == 0
+    red *= r_mult
+    red += r_add
+    nir *= n_mult
+    nir += n_add
+
+    # The sum and the zero mask are computed once, and the difference is
+    # written into the NIR buffer instead of a new temporary
+    denom = nir + red
+    zero = fill | (denom == 0)
+    ndvi = np.subtract(nir, red, out=nir)
+    np.divide(ndvi, denom, out=ndvi, where=~zero)
+
+    # Optional: mask pixels where NIR + Red == 0
+    ndvi[zero] = np.nan
+    np.clip(ndvi, -1, 1, out=ndvi)  # optional, just to limit values
+    return quantize_ndvi(ndvi, out)
+
+
+def quantize_ndvi(ndvi, out):
+    """Scale a float32 NDVI window to int16, with NaN mapped to NDVI_NODATA"""
+    np.multiply(ndvi, NDVI_SCALE, out=ndvi)
+    np.rint(ndvi, out=ndvi)
+    ndvi[np.isnan(ndvi)] = NDVI_NODATA
+    np.copyto(out, ndvi, casting='unsafe')
+    return out
+
+
+def read_band_windows(red_src, nir_src, windows):
+    """
+    Yield (window, red, nir) float32 blocks, prefetching the next block
+
+    Both bands are read on a small thread pool (rasterio releases the GIL
+    during reads) while the caller computes and writes the current block.
+    Each dataset only ever has one read in flight.
+
+    Reads land in two alternating sets of preallocated tile buffers, so a
+    yielded block is only valid until the one after it is requested.
+    """
+    if not windows:
+        return
+
+    shape = (windows[0].height, windows[0].width)
+    buffers = [[np.empty(shape, dtype=np.float32) for _ in range(2)]
+               for _ in range(2)]
+
+    def read(src, window, buf):
+        buf = tile_buffer(buf, (window.height, window.width), np.float32)
+        return src.read(1, window=window, out=buf)
+
+    with ThreadPoolExecutor(max_workers=2) as pool:
+        def submit(k):
+            red_buf, nir_buf = buffers[k % 2]
+            return (pool.submit(read, red_src, windows[k], red_buf),
+                    pool.submit(read, nir_src, windows[k], nir_buf))
+
+        pending = submit(0)
+        for k, window in enumerate(windows):
+            red, nir = (future.result() for future in pending)
+            if k + 1 < len(windows):
+                pending = submit(k + 1)
+            yield window, red, nir
+
+
+def tile_shape(src):
+    """(rows, cols) of the NDVI tiles: the input's own blocks if it is tiled"""
+    if src.profile.get('tiled'):
+        return src.block_shapes[0]
+    return (TILE_SIZE, TILE_SIZE)
+
+
+def read_reflectance_coefficients(red_path):
+    """
+    Read REFLECTANCE_MULT/ADD for bands 4 and 5 from the scene's *_MTL.txt
+
+    Collection-2 Level-2 MTL files carry both the Level-1 TOA and the
+    Level-2 surface reflectance coefficients; the surface reflectance ones
+    win, since those are what the SR bands are scaled with.
+
+    Returns:
+        (red_mult, red_add, nir_mult, nir_add), or None if there is no MTL
+    """
+    name = red_path.name
+    for suffix in ('SR_B4.TIF', 'B4.TIF'):
+        if name.endswith(suffix):
+            name = name[:-len(suffix)]
+            break
+    mtl_path = red_path.with_name(f"{name}MTL.txt")
+    if not mtl_path.exists():
+        return None
+
+    keys = ('REFLECTANCE_MULT_BAND_4', 'REFLECTANCE_ADD_BAND_4',
+            'REFLECTANCE_MULT_BAND_5', 'REFLECTANCE_ADD_BAND_5')
+    values = {}
+    group = None
+    with open(mtl_path) as mtl:
+        for line in mtl:
+            key, _, value = (part.strip() for part in line.partition('='))
+            if key == 'GROUP':
+                group = value
+            elif key in keys and (key not in values
+                                  or group == 'LEVEL2_SURFACE_REFLECTANCE_PARAMETERS'):
+                values[key] = float(value)
+
+    if len(values) != len(keys):
+        return None
+    return tuple(values[key] for key in keys)
+
+
+def init_worker():
+    """Per-process setup for the scene pool, run once instead of per scene"""
+    np.seterr(divide='ignore', invalid='ignore')  # suppress warnings
+
+
+def process_scene(red_path, j, total):
+    """Compute NDVI for one B4/B5 pair and save it as data/ndvi_{j}.tif with overviews"""
+    print(f"Processing scene {j}/{total}: {red_path.name}")
+    nir_path = red_path.with_name(red_path.name.replace('B4.TIF', 'B5.TIF'))
+
+    coefficients = read_reflectance_coefficients(red_path)
+    if coefficients is None:
+        print("  No MTL metadata found, computing NDVI from raw DNs")
+        coefficients = DN_COEFFICIENTS
+
+    with rasterio.Env(**GDAL_ENV):
+        print(f"  Opening Red band: {red_path.name}")
+        print(f"  Opening NIR band: {nir_path.name}")
+        with rasterio.open(red_path) as red_src, rasterio.open(nir_path) as nir_src:
+            profile = red_src.profile  # keep georeference info
+            # Tiled DEFLATE with the integer predictor, encoded on all cores.
+            # Output tiling mirrors COG inputs so each tile decodes exactly
+            # one input block per band; SPARSE_OK leaves skipped fill tiles
+            # unwritten, and they read back as nodata.
+            rows, cols = tile_shape(red_src)
+            profile.update(dtype=rasterio.int16, count=1, nodata=NDVI_NODATA,
+                           tiled=True, blockxsize=cols, blockysize=rows,
+                           compress='deflate', predictor=2, num_threads='all_cpus',
+                           BIGTIFF='IF_SAFER', sparse_ok=True)
+
+            print(f"  Calculating NDVI and saving raster: data/ndvi_{j}.tif")
+            #Compute NDVI - or Normalized Difference Vegetation Index, is a remote sensing indicator that measures vegetation health, density, and greenness
+
+            #save NDVI as geotiff
+            with rasterio.open(f"data/ndvi_{j}.tif", 'w', **profile) as dst:
+                dst.scales = (1 / NDVI_SCALE,)
+                dst.update_tags(scale_factor=1 / NDVI_SCALE)
+                # Walk the output tiles so only the current and the prefetched
+                # window of each band are held in memory, independent of how
+                # the inputs are laid out on disk (striped inputs would
+                # otherwise yield one tiny window per strip)
+                windows = [window for _, window in dst.block_windows(1)]
+                out = np.empty((rows, cols), dtype=np.int16)
+                for window, red, nir in read_band_windows(red_src, nir_src, windows):
+                    if not (red.any() or nir.any()):
+                        continue  # Landsat fill (DN 0 in both bands): all nodata
+                    dst.write(ndvi_tile(red, nir, coefficients, out), 1, window=window)
+
+        #build overviews instead of a separate preview image
+        with rasterio.open(f"data/ndvi_{j}.tif", 'r+') as dst:
+            dst.build_overviews(OVERVIEW_FACTORS, Resampling.average)
+            dst.update_tags(ns='rio_overview', resampling='average')
+    print(f"NDVI overviews built for data/ndvi_{j}.tif")
+
+
+def main():
+    """Compute NDVI for every B4/B5 pair in data_filepath"""
+    b4_files = sorted(Path(data_filepath).glob(b4_pattern))
+
+    print(f"Found {len(b4_files)} Landsat scenes to process")
+    if not b4_files:
+        return
+
+    os.makedirs('data', exist_ok=True)  # Ensure data directory exists
+
+    # Scenes are independent (disjoint inputs and outputs), so each one runs
+    # in its own process
+    total = len(b4_files)
+    with ProcessPoolExecutor(max_workers=min(total, os.cpu_count() or 1),
+                             initializer=init_worker) as executor:
+        list(executor.map(process_scene, b4_files, range(1, total + 1), [total] * total))
+
+
+if __name__ == "__main__":
+    main()